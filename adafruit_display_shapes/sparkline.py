@@ -4,9 +4,9 @@
 
 # class of sparklines in CircuitPython
 
-# See the bottom for a code example using the `sparkline` Class.
+# See examples/display_shapes_sparkline_simpletest.py for a code example
+# using the `Sparkline` class.
 
-# # File: display_shapes_sparkline.py
 # A sparkline is a scrolling line graph, where any values added to sparkline using `
 # add_value` are plotted.
 #
@@ -43,8 +43,171 @@ except ImportError:
 
 # pylint: disable=too-many-instance-attributes
 
+from array import array
+
 import displayio
-from adafruit_display_shapes.line import Line
+
+try:
+    # numpy is available on CPython/Blinka and keeps the per-point arithmetic
+    # in C loops
+    import numpy as np
+except ImportError:
+    try:
+        # CircuitPython builds with ulab provide the same subset of the API
+        from ulab import numpy as np
+    except ImportError:
+        # neither is present: fall back to the scalar path
+        np = None
+
+
+def _vector_supported():
+    # The ulab subset varies between builds, so probe every array operation
+    # the vectorized path relies on (including that frombuffer reads the
+    # ring buffer's 4-byte floats correctly) instead of assuming the full
+    # numpy API; anything missing means the scalar path is used instead.
+    try:
+        probe = np.frombuffer(array("f", [0.0, 2.0]), dtype=_FLOAT32).astype(_FLOAT)
+        cols = np.frombuffer(array("h", [0, 3]), dtype=np.int16)
+        scaled = (np.arange(2) * 1.5).astype(np.int16)
+        codes = np.where(probe < 1.0, 1, 0) | np.where(probe > 1.0, 2, 0)
+        reject = (codes[:-1] & codes[1:]) != 0
+        return (
+            float(probe[1]) == 2.0
+            and int(cols[1]) == 3
+            and int(scaled[1]) == 1
+            and not bool(reject[0])
+        )
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+if np is not None:
+    # 4-byte float view of the ring buffer storage, and the widest float the
+    # build offers for the arithmetic: float64 matches the Python-float scalar
+    # path pixel for pixel, while ulab only guarantees a generic float
+    _FLOAT32 = getattr(np, "float32", None) or getattr(np, "float", None)
+    _FLOAT = getattr(np, "float64", None) or _FLOAT32
+    HAS_VECTOR = _FLOAT32 is not None and _vector_supported()
+else:
+    _FLOAT32 = None
+    _FLOAT = None
+    HAS_VECTOR = False
+
+try:
+    # numba, when present, compiles the whole clip-and-scale loop to
+    # machine code; it is never required
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _build_segments(vals, xs, height, y_bottom, y_top):
+    # pylint: disable=invalid-name, too-many-locals
+    # Scale and Liang-Barsky-clip every segment in one pass, returning an
+    # (n, 4) int16 array of pixel endpoints.  The clip logic mirrors
+    # Sparkline._clip_segment but is kept self-contained (and branch-unrolled)
+    # so that numba can compile it in nopython mode.
+    count = vals.shape[0]
+    segments = np.empty((count - 1, 4), dtype=np.int16)
+    y_scale = height / (y_top - y_bottom)
+
+    found = 0
+    for i in range(1, count):
+        x_1 = int(xs[i - 1])
+        x_2 = int(xs[i])
+        v_1 = vals[i - 1]
+        d_v = vals[i] - v_1
+
+        t_0 = 0.0
+        t_1 = 1.0
+        accept = True
+
+        for edge in range(2):
+            if edge == 0:  # v >= y_bottom
+                p = -d_v
+                q = v_1 - y_bottom
+            else:  # v <= y_top
+                p = d_v
+                q = y_top - v_1
+            if p == 0:
+                if q < 0:
+                    accept = False
+                    break
+            else:
+                t = q / p
+                if p < 0:
+                    if t > t_1:
+                        accept = False
+                        break
+                    t_0 = max(t_0, t)
+                else:
+                    if t < t_0:
+                        accept = False
+                        break
+                    t_1 = min(t_1, t)
+
+        if accept:
+            d_x = x_2 - x_1
+            segments[found, 0] = int(x_1 + t_0 * d_x)
+            segments[found, 1] = int((y_top - (v_1 + t_0 * d_v)) * y_scale)
+            segments[found, 2] = int(x_1 + t_1 * d_x)
+            segments[found, 3] = int((y_top - (v_1 + t_1 * d_v)) * y_scale)
+            found += 1
+
+    return segments[:found]
+
+
+def _raster_segments(segments, height):
+    # pylint: disable=invalid-name, too-many-locals
+    # Run Bresenham over every segment in one call, returning the x and y
+    # coordinates of all pixels to set.  Like _build_segments this stays
+    # self-contained so numba can compile it in nopython mode.
+    total = 0
+    for i in range(segments.shape[0]):  # upper bound on the pixel count
+        total += (
+            abs(segments[i, 2] - segments[i, 0])
+            + abs(segments[i, 3] - segments[i, 1])
+            + 1
+        )
+    xs = np.empty(total, dtype=np.int16)
+    ys = np.empty(total, dtype=np.int16)
+
+    found = 0
+    bottom = height - 1
+    for i in range(segments.shape[0]):
+        x0 = int(segments[i, 0])
+        y0 = min(int(segments[i, 1]), bottom)
+        x1 = int(segments[i, 2])
+        y1 = min(int(segments[i, 3]), bottom)
+
+        dx = abs(x1 - x0)
+        sx = 1 if x0 < x1 else -1
+        dy = -abs(y1 - y0)
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+
+        while True:
+            xs[found] = x0
+            ys[found] = y0
+            found += 1
+            if x0 == x1 and y0 == y1:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+
+    return xs[:found], ys[:found]
+
+
+if HAS_NUMBA:
+    _build_segments = njit(cache=True)(_build_segments)
+    _raster_segments = njit(cache=True)(_raster_segments)
 
 
 class Sparkline(displayio.Group):
@@ -59,6 +222,13 @@ class Sparkline(displayio.Group):
     :param x: X-position on the screen, in pixels
     :param y: Y-position on the screen, in pixels
     :param color: Line color, the default value is 0xFFFFFF (WHITE)
+
+    Note: All line segments are drawn into one shared bitmap, so each call
+    to :meth:`update` presents displayio with a single dirty region and the
+    display refreshes it in one transfer.  When several sparklines (or other
+    elements) must change together, bracket the updates with
+    ``display.auto_refresh = False`` ... ``display.auto_refresh = True`` so
+    the display shows all of them in the same frame.
     """
 
     def __init__(
@@ -76,11 +246,17 @@ class Sparkline(displayio.Group):
         # define class instance variables
         self.width = width  # in pixels
         self.height = height  # in pixels
-        self.color = color  #
         self._max_items = max_items  # maximum number of items in the list
-        self._spark_list: List[float] = []  # list containing the values
-        self.y_min = y_min  # minimum of y-axis (None: autoscale)
-        self.y_max = y_max  # maximum of y-axis (None: autoscale)
+        # preallocated ring buffer of the values: packed 4-byte floats rather
+        # than a list of boxed objects; _head is the index of the oldest value
+        self._spark_list = array("f", [0.0] * max_items)
+        self._head = 0
+        self._count = 0
+        # set False to batch additions: add_value then only stores the value
+        # and the caller triggers the redraw with update()
+        self.auto_update = True
+        self._y_min = y_min  # minimum of y-axis (None: autoscale)
+        self._y_max = y_max  # maximum of y-axis (None: autoscale)
         self.y_bottom = y_min
         # y_bottom: The actual minimum value of the vertical scale, will be
         # updated if autorange
@@ -90,63 +266,257 @@ class Sparkline(displayio.Group):
         self._x = x
         self._y = y
 
-        super().__init__(x=x, y=y)  # self is a group of lines
+        self._y_scale = None  # pixels per value unit, resolved on each update
+
+        # state used to detect when an update can scroll the canvas and
+        # draw only the newly added segment instead of redrawing everything
+        if max_items > 1 and (width - 1) % (max_items - 1) == 0:
+            self._scroll_step = (width - 1) // (max_items - 1)
+        else:
+            self._scroll_step = 0  # x grid is not uniform; no scroll fast path
+        # x pixel position of every point once the buffer is full; while the
+        # buffer is filling the pitch depends on the count, so the positions
+        # are computed per update instead
+        xpitch = (width - 1) / (max_items - 1) if max_items > 1 else 0.0
+        self._x_grid = array("h", [int(xpitch * i) for i in range(max_items)])
+        self._new_values = 0  # values added since the last update
+        self._dirty = False  # True when the drawing no longer matches the data
+        self._last_count = 0
+        self._last_y_bottom = None
+        self._last_y_top = None
+
+        # All segments are rasterized into one shared canvas bitmap, so each
+        # update dirties a single region instead of one area per line segment
+        self._palette = displayio.Palette(2)
+        self._palette.make_transparent(0)
+        self._bitmap = displayio.Bitmap(width, height, 2)
+        self.color = color
+
+        super().__init__(x=x, y=y)  # self is a group holding the canvas
+        self.append(displayio.TileGrid(self._bitmap, pixel_shader=self._palette))
+
+        self._select_update()
+
+    def _select_update(self):
+        # while both limits are fixed the y range can never change, so
+        # resolve the range and scale factor once here and let update()
+        # dispatch straight to the path that skips the autorange work
+        self._fixed_range = self._y_min is not None and self._y_max is not None
+        if self._fixed_range:
+            self.y_bottom = self._y_min
+            self.y_top = self._y_max
+            if self.y_top == self.y_bottom:
+                self.y_bottom -= 10
+                self.y_top += 10
+            self._y_scale = self.height / (self.y_top - self.y_bottom)
+
+    @property
+    def y_min(self) -> Optional[float]:
+        """Lower limit of the y-axis, or None for autorange.  Assigning to
+        it marks the sparkline for redraw on the next update."""
+        return self._y_min
+
+    @y_min.setter
+    def y_min(self, value: Optional[float]) -> None:
+        self._y_min = value
+        self._select_update()
+        # the canvas was drawn at the old scale, so the next update must
+        # redraw everything rather than scroll the stale picture
+        self._last_count = 0
+        self._dirty = True
+
+    @property
+    def y_max(self) -> Optional[float]:
+        """Upper limit of the y-axis, or None for autorange.  Assigning to
+        it marks the sparkline for redraw on the next update."""
+        return self._y_max
+
+    @y_max.setter
+    def y_max(self, value: Optional[float]) -> None:
+        self._y_max = value
+        self._select_update()
+        # the canvas was drawn at the old scale, so the next update must
+        # redraw everything rather than scroll the stale picture
+        self._last_count = 0
+        self._dirty = True
+
+    @property
+    def color(self) -> Optional[int]:
+        """The line color value. Can be a hex value for a color or
+        ``None`` for no line color."""
+        return self._color
+
+    @color.setter
+    def color(self, color: Optional[int]) -> None:
+        # keep the assigned value so None reads back as None; the palette
+        # only ever holds the rendered entry
+        self._color = color
+        if color is None:
+            self._palette[1] = 0
+            self._palette.make_transparent(1)
+        else:
+            self._palette[1] = color
+            self._palette.make_opaque(1)
 
     def clear_values(self):
-        """Removes all values from the _spark_list list and removes all lines in the group"""
+        """Removes all values from the _spark_list list and clears the drawing"""
 
-        for _ in range(len(self)):  # remove all items from the current group
-            self.pop()
-        self._spark_list = []  # empty the list
+        self._bitmap.fill(0)  # clear the canvas
+        self._head = 0  # empty the ring buffer; the storage stays allocated
+        self._count = 0
+        self._new_values = 0
+        self._dirty = False  # the blank canvas already matches the empty data
+        self._last_count = 0
 
     def add_value(self, value: Optional[float]):
-        """Add a value to the sparkline.
+        """Add a value to the sparkline.  The drawing updates immediately
+        unless :attr:`auto_update` is False.
         :param value: The value to be added to the sparkline
         """
 
         if value is not None:
-            if (
-                len(self._spark_list) >= self._max_items
-            ):  # if list is full, remove the first item
-                self._spark_list.pop(0)
-            self._spark_list.append(value)
+            self._store_value(value)
+            if self.auto_update:
+                self.update()
+
+    def extend(self, values) -> None:
+        """Add each value from an iterable to the sparkline, then update
+        the drawing once at the end — much cheaper than one redraw per
+        value when samples arrive in bursts.
+        :param values: An iterable of values; None entries are skipped
+        """
+
+        added = False
+        for value in values:
+            if value is not None:
+                self._store_value(value)
+                added = True
+        if added:
             self.update()
 
-    # pylint: disable=no-else-return
-    @staticmethod
-    def _xintercept(
-        x_1: float, y_1: float, x_2: float, y_2: float, horizontal_y: float
-    ) -> Optional[int]:  # finds intercept of the line and a horizontal line at horizontalY
-        slope = (y_2 - y_1) / (x_2 - x_1)
-        b = y_1 - slope * x_1
-
-        if slope == 0 and y_1 != horizontal_y:  # does not intercept horizontalY
-            return None
+    def _store_value(self, value: float):
+        # append to the ring buffer, overwriting the oldest value when full
+        if self._count < self._max_items:
+            self._spark_list[self._count] = value
+            self._count += 1
         else:
-            xint = (
-                horizontal_y - b
-            ) / slope  # calculate the x-intercept at position y=horizontalY
-            return int(xint)
-
-    def _plotline(self, x_1: int, last_value: int, x_2: int, value: int, y_bottom: int, y_top: int):
+            self._spark_list[self._head] = value
+            self._head = (self._head + 1) % self._max_items
+        self._new_values += 1
+        self._dirty = True
+
+    def _ordered_values(self) -> array:
+        # materialize the ring buffer contents oldest-first; until the buffer
+        # wraps for the first time _head stays 0 and this is a plain slice
+        if self._head:
+            return self._spark_list[self._head :] + self._spark_list[: self._head]
+        return self._spark_list[: self._count]
 
-        y_2 = int(self.height * (y_top - value) / (y_top - y_bottom))
-        y_1 = int(self.height * (y_top - last_value) / (y_top - y_bottom))
-        self.append(Line(x_1, y_1, x_2, y_2, self.color))  # plot the line
+    @staticmethod
+    def _clip_segment(
+        x_1: int, v_1: float, x_2: int, v_2: float, y_min: float, y_max: float
+    ) -> Optional[tuple]:
+        # Liang-Barsky clip of the segment against the two horizontal edges
+        # of the y range; returns the adjusted endpoints, or None when the
+        # segment lies entirely out of range
+        d_v = v_2 - v_1
+        t_0 = 0.0
+        t_1 = 1.0
+
+        for denom, dist in ((-d_v, v_1 - y_min), (d_v, y_max - v_1)):
+            if denom == 0:
+                if dist < 0:  # parallel to the edge and outside it
+                    return None
+            else:
+                t_hit = dist / denom
+                if denom < 0:
+                    if t_hit > t_1:
+                        return None
+                    t_0 = max(t_0, t_hit)
+                else:
+                    if t_hit < t_0:
+                        return None
+                    t_1 = min(t_1, t_hit)
+
+        d_x = x_2 - x_1
+        return (
+            int(x_1 + t_0 * d_x),
+            v_1 + t_0 * d_v,
+            int(x_1 + t_1 * d_x),
+            v_1 + t_1 * d_v,
+        )
+
+    def _plotline(self, x_1: int, last_value: float, x_2: int, value: float):
+
+        y_2 = int((self.y_top - value) * self._y_scale)
+        y_1 = int((self.y_top - last_value) * self._y_scale)
+        self._emit_segment(x_1, y_1, x_2, y_2)  # plot the line
+
+    def _emit_segment(self, x_1: int, y_1: int, x_2: int, y_2: int):
+        # rasterize the segment into the canvas bitmap; rows are clamped
+        # because a value exactly at y_bottom scales to row == height
+        bottom = self.height - 1
+        self._line(x_1, min(y_1, bottom), x_2, min(y_2, bottom))
+
+    # pylint: disable=invalid-name
+    def _line(self, x0: int, y0: int, x1: int, y1: int):
+        bitmap = self._bitmap
+        if x0 == x1:
+            if y0 > y1:
+                y0, y1 = y1, y0
+            for _h in range(y0, y1 + 1):
+                bitmap[x0, _h] = 1
+        elif y0 == y1:
+            if x0 > x1:
+                x0, x1 = x1, x0
+            for _w in range(x0, x1 + 1):
+                bitmap[_w, y0] = 1
+        else:
+            # all-integer Bresenham: no steep/shallow transpose and no
+            # float error term, just integer adds and compares per pixel
+            dx = abs(x1 - x0)
+            sx = 1 if x0 < x1 else -1
+            dy = -abs(y1 - y0)
+            sy = 1 if y0 < y1 else -1
+            err = dx + dy
+
+            while True:
+                bitmap[x0, y0] = 1
+                if x0 == x1 and y0 == y1:
+                    break
+                e2 = 2 * err
+                if e2 >= dy:
+                    err += dy
+                    x0 += sx
+                if e2 <= dx:
+                    err += dx
+                    y0 += sy
+
+    # pylint: enable=invalid-name
 
     # pylint: disable= too-many-branches, too-many-nested-blocks
 
     def update(self):
-        """Update the drawing of the sparkline."""
+        """Update the drawing of the sparkline.  Does nothing when neither
+        the data nor the y range changed since the last update."""
+
+        if not self._dirty:
+            return
+
+        if self._fixed_range:
+            self._update_fixed_range()
+            return
+
+        vals = self._ordered_values()
 
         # get the y range
         if self.y_min is None:
-            self.y_bottom = min(self._spark_list)
+            self.y_bottom = min(vals)
         else:
             self.y_bottom = self.y_min
 
         if self.y_max is None:
-            self.y_top = max(self._spark_list)
+            self.y_top = max(vals)
         else:
             self.y_top = self.y_max
 
@@ -155,80 +525,222 @@ class Sparkline(displayio.Group):
             self.y_bottom -= 10
             self.y_top += 10
 
-        if len(self._spark_list) > 2:
-            xpitch = (self.width - 1) / (
-                len(self._spark_list) - 1
-            )  # this is a float, only make int when plotting the line
-
-            for _ in range(len(self)):  # remove all items from the current group
-                self.pop()
-
-            for count, value in enumerate(self._spark_list):
-                if count == 0:
-                    pass  # don't draw anything for a first point
-                else:
-                    x_2 = int(xpitch * count)
-                    x_1 = int(xpitch * (count - 1))
-
-                    if (self.y_bottom <= last_value <= self.y_top) and (
-                        self.y_bottom <= value <= self.y_top
-                    ):  # both points are in range, plot the line
-                        self._plotline(
-                            x_1, last_value, x_2, value, self.y_bottom, self.y_top
-                        )
-
-                    else:  # at least one point is out of range, clip one or both ends the line
-                        if ((last_value > self.y_top) and (value > self.y_top)) or (
-                            (last_value < self.y_bottom) and (value < self.y_bottom)
-                        ):
-                            # both points are on the same side out of range: don't draw anything
-                            pass
-                        else:
-                            xint_bottom = self._xintercept(
-                                x_1, last_value, x_2, value, self.y_bottom
-                            )  # get possible new x intercept points
-                            xint_top = self._xintercept(
-                                x_1, last_value, x_2, value, self.y_top
-                            )  # on the top and bottom of range
-
-                            if (xint_bottom is None) or (
-                                xint_top is None
-                            ):  # out of range doublecheck
-                                pass
-                            else:
-                                # Initialize the adjusted values as the baseline
-                                adj_x_1 = x_1
-                                adj_last_value = last_value
-                                adj_x_2 = x_2
-                                adj_value = value
-
-                                if value > last_value:  # slope is positive
-                                    if xint_bottom >= x_1:  # bottom is clipped
-                                        adj_x_1 = xint_bottom
-                                        adj_last_value = self.y_bottom  # y_1
-                                    if xint_top <= x_2:  # top is clipped
-                                        adj_x_2 = xint_top
-                                        adj_value = self.y_top  # y_2
-                                else:  # slope is negative
-                                    if xint_top >= x_1:  # top is clipped
-                                        adj_x_1 = xint_top
-                                        adj_last_value = self.y_top  # y_1
-                                    if xint_bottom <= x_2:  # bottom is clipped
-                                        adj_x_2 = xint_bottom
-                                        adj_value = self.y_bottom  # y_2
-
-                                self._plotline(
-                                    adj_x_1,
-                                    adj_last_value,
-                                    adj_x_2,
-                                    adj_value,
-                                    self.y_bottom,
-                                    self.y_top,
-                                )
-
-                last_value = value  # store value for the next iteration
-
-    def values(self):
+        # the scale factor is invariant across the whole update, so resolve
+        # it once here rather than once per segment in _plotline
+        self._y_scale = self.height / (self.y_top - self.y_bottom)
+
+        count = len(vals)
+
+        # steady state: the picture is the previous one shifted left one
+        # slot, so scroll the canvas and draw only the newest segment
+        can_scroll = (
+            self._new_values == 1
+            and self._scroll_step
+            and count > 2  # degenerate buffers always take the redraw branch
+            and count == self._max_items
+            and self._last_count == self._max_items
+        )
+        if (
+            can_scroll
+            and self.y_bottom == self._last_y_bottom
+            and self.y_top == self._last_y_top
+        ):
+            self._scroll_and_draw_last(vals)
+        elif count > 2:
+            self._redraw_all(vals)
+
+        self._new_values = 0
+        self._dirty = False
+        self._last_count = count
+        self._last_y_bottom = self.y_bottom
+        self._last_y_top = self.y_top
+
+    def _update_fixed_range(self):
+        # the update path taken when both y_min and y_max are supplied: the
+        # y range and scale factor were already resolved by _select_update,
+        # so no autorange work is done here (update() checks the dirty flag)
+
+        vals = self._ordered_values()
+        count = len(vals)
+
+        if (
+            self._new_values == 1
+            and self._scroll_step
+            and count > 2  # degenerate buffers always take the redraw branch
+            and count == self._max_items
+            and self._last_count == self._max_items
+        ):
+            self._scroll_and_draw_last(vals)
+        elif count > 2:
+            self._redraw_all(vals)
+
+        self._new_values = 0
+        self._dirty = False
+        self._last_count = count
+
+    def _redraw_all(self, vals: array):
+        # clear the canvas, then redraw every segment with the fastest
+        # available implementation
+        self._bitmap.fill(0)
+
+        if HAS_NUMBA:
+            self._draw_segments_jit(vals)
+        elif HAS_VECTOR:
+            self._draw_segments_vectorized(vals)
+        else:
+            self._draw_segments(vals)
+
+    def _scroll_and_draw_last(self, vals: array):
+        # requires a uniform x grid (integer pixel pitch), a full ring buffer
+        # and an unchanged y range, as checked by update()
+        step = self._scroll_step
+        width = self.width
+        height = self.height
+        bitmap = self._bitmap
+
+        try:
+            # blit copies in increasing order, so the overlapping leftward
+            # self-copy behaves like a memmove
+            bitmap.blit(0, 0, bitmap, x1=step, y1=0, x2=width, y2=height)
+        except (AttributeError, TypeError, ValueError):
+            for x in range(width - step):  # no blit available: shift by pixel
+                for y in range(height):
+                    bitmap[x, y] = bitmap[x + step, y]
+
+        for x in range(width - step, width):  # clear the vacated columns
+            for y in range(height):
+                bitmap[x, y] = 0
+
+        # column 0 may still hold pixels that the dropped oldest segment bled
+        # into its right endpoint column, so clear it and redraw the (shifted,
+        # overdraw-safe) first segment along with the brand-new last one
+        for y in range(height):
+            bitmap[0, y] = 0
+        self._draw_segment_pair(0, vals[0], step, vals[1])
+        self._draw_segment_pair(width - 1 - step, vals[-2], width - 1, vals[-1])
+
+    def _draw_segment_pair(self, x_1: int, last_value: float, x_2: int, value: float):
+        # outcode dispatch for a single segment: draw, clip or reject it
+
+        y_bottom = self.y_bottom
+        y_top = self.y_top
+        last_code = (
+            0
+            if y_bottom <= last_value <= y_top
+            else (1 if last_value < y_bottom else 2)
+        )
+        code = 0 if y_bottom <= value <= y_top else (1 if value < y_bottom else 2)
+
+        if last_code & code:
+            pass  # both points out of range on the same side: nothing to draw
+        elif last_code | code == 0:
+            self._plotline(x_1, last_value, x_2, value)
+        else:
+            self._plot_clipped(x_1, last_value, x_2, value)
+
+    # pylint: disable=invalid-name
+    def _draw_segments(self, vals: array):
+        # scalar fallback: scale, range-test and clip one segment at a time
+
+        # hoist every attribute and method used per segment into locals; on
+        # the CircuitPython VM each saved LOAD_ATTR in this loop is measurable
+        count = len(vals)
+        y_bottom = self.y_bottom
+        y_top = self.y_top
+        y_scale = self._y_scale
+        emit_segment = self._emit_segment
+        plot_clipped = self._plot_clipped
+        if count == self._max_items:  # steady state: reuse the x grid
+            xs = self._x_grid
+        else:
+            xpitch = (self.width - 1) / (count - 1)
+            xs = [int(xpitch * i) for i in range(count)]  # x position of each point
+
+        for i, value in enumerate(vals):
+            # Cohen-Sutherland style outcode: 1 = below the range, 2 = above
+            code = 0 if y_bottom <= value <= y_top else (1 if value < y_bottom else 2)
+
+            if i != 0:
+                if last_code & code:
+                    pass  # both points out of range on the same side: nothing to draw
+                elif last_code | code == 0:  # both points are in range, plot the line
+                    emit_segment(
+                        xs[i - 1],
+                        int((y_top - last_value) * y_scale),
+                        xs[i],
+                        int((y_top - value) * y_scale),
+                    )
+                else:  # one point is out of range, clip one or both ends of the line
+                    plot_clipped(xs[i - 1], last_value, xs[i], value)
+
+            last_value = value  # store value and outcode for the next iteration
+            last_code = code
+
+    def _x_positions(self, count: int):
+        # int16 x position of each point, reusing the precomputed grid in
+        # the steady state (numpy paths only)
+        if count == self._max_items:
+            return np.frombuffer(self._x_grid, dtype=np.int16)
+        xpitch = (self.width - 1) / (count - 1)
+        return (np.arange(count) * xpitch).astype(np.int16)
+
+    def _draw_segments_jit(self, vals: array):
+        # run the clip-and-scale loop and the Bresenham rasterization inside
+        # the compiled kernels; Python only transfers pixels into the bitmap
+
+        count = len(vals)
+        vals = np.frombuffer(vals, dtype=_FLOAT32).astype(_FLOAT)
+        segments = _build_segments(
+            vals, self._x_positions(count), self.height, self.y_bottom, self.y_top
+        )
+        xs, ys = _raster_segments(segments, self.height)
+        bitmap = self._bitmap
+        for i in range(xs.shape[0]):
+            bitmap[int(xs[i]), int(ys[i])] = 1
+
+    def _draw_segments_vectorized(self, vals: array):
+        # batch the scaling and range tests as numpy array operations; only
+        # segment emission (and the occasional clipped segment) stays in Python
+
+        count = len(vals)
+        vals = np.frombuffer(vals, dtype=_FLOAT32).astype(_FLOAT)
+        y_top = self.y_top
+        y_bottom = self.y_bottom
+
+        xs = self._x_positions(count)
+        ys = ((y_top - vals) * self._y_scale).astype(np.int16)
+        in_range = (vals >= y_bottom) & (vals <= y_top)
+        # outcodes (1 = below, 2 = above); a nonzero AND of neighboring codes
+        # means the whole segment is out of range on one side
+        codes = np.where(vals < y_bottom, 1, 0) | np.where(vals > y_top, 2, 0)
+        reject = (codes[:-1] & codes[1:]) != 0
+
+        for i in range(1, count):
+            if in_range[i - 1] and in_range[i]:
+                self._emit_segment(
+                    int(xs[i - 1]), int(ys[i - 1]), int(xs[i]), int(ys[i])
+                )
+            elif not reject[i - 1]:
+                self._plot_clipped(
+                    int(xs[i - 1]), float(vals[i - 1]), int(xs[i]), float(vals[i])
+                )
+
+    # pylint: enable=invalid-name
+
+    def _plot_clipped(self, x_1: int, last_value: float, x_2: int, value: float):
+        # at least one endpoint is out of range: clip the segment to the
+        # y range, or skip it entirely when both ends are on the same side
+
+        clipped = self._clip_segment(
+            x_1, last_value, x_2, value, self.y_bottom, self.y_top
+        )
+        if clipped is None:  # the whole segment is out of range
+            return
+
+        adj_x_1, adj_last_value, adj_x_2, adj_value = clipped
+        self._plotline(adj_x_1, adj_last_value, adj_x_2, adj_value)
+
+    def values(self) -> List[float]:
         """Returns the values displayed on the sparkline."""
 
-        return self._spark_list
+        return list(self._ordered_values())
@@ -30,8 +30,9 @@
 # 	add new values to sparkline `add_value`
 # 	update the sparklines `update`
 
-import time
 import random
+from array import array
+
 import board
 import displayio
 
@@ -47,6 +48,11 @@ if "DISPLAY" not in dir(board):
     displayio.release_displays()
 
     # setup the SPI bus
+    # board.SPI() is the hardware SPI peripheral (a singleton), which is what
+    # lets displayio drive the refresh with DMA bursts on ports that support
+    # it; a bitbangio.SPI bus here would fall back to CPU-paced transfers.
+    # Boards with exposed parallel pins can go faster still by swapping this
+    # FourWire setup for paralleldisplaybus.ParallelBus.
     spi = board.SPI()
     tft_cs = board.D9  # arbitrary, pin not used
     tft_dc = board.D10
@@ -54,8 +60,8 @@ if "DISPLAY" not in dir(board):
     tft_reset = board.D11
 
     while not spi.try_lock():
-        spi.configure(baudrate=32000000)
-
+        pass
+    spi.configure(baudrate=40000000, polarity=0, phase=0)
     spi.unlock()
 
     display_bus = displayio.FourWire(
@@ -63,9 +69,9 @@ if "DISPLAY" not in dir(board):
         command=tft_dc,
         chip_select=tft_cs,
         reset=tft_reset,
-        baudrate=32000000,
-        polarity=1,
-        phase=1,
+        baudrate=40000000,
+        polarity=0,
+        phase=0,
     )
 
     print("spi.frequency: {}".format(spi.frequency))
@@ -80,8 +86,10 @@ if "DISPLAY" not in dir(board):
         width=DISPLAY_WIDTH,
         height=DISPLAY_HEIGHT,
         rotation=180,  # The rotation can be adjusted to match your configuration.
-        auto_refresh=True,
-        native_frames_per_second=90,
+        auto_refresh=False,
+        # the ILI9341 panel refreshes at ~60-70 Hz natively; scheduling
+        # faster only spends SPI bandwidth on frames it cannot show
+        native_frames_per_second=60,
     )
 
     # reset the display to show nothing.
@@ -90,6 +98,11 @@ else:
     # built-in display
     display = board.DISPLAY
 
+# The main loop calls display.refresh() itself, once per sample, so turn
+# auto_refresh off for good: the bus is then only used when new pixels exist,
+# with no per-iteration re-arming of the refresh timer.
+display.auto_refresh = False
+
 ##########################################
 # Create background bitmaps and sparklines
 ##########################################
@@ -104,35 +117,35 @@ sparkline1 = Sparkline(
     width=chart_width, height=chart_height, max_items=40, y_min=0, y_max=10, x=0, y=0
 )
 
-# Create a group to hold the sparkline and append the sparkline into the
-# group (my_group)
-#
-# Note: In cases where display elements will overlap, then the order the elements
-# are added to the group will set which is on top.  Latter elements are displayed
-# on top of former elements.
-my_group = displayio.Group()
-
-# add the sparkline into my_group
-my_group.append(sparkline1)
-
-
-# Add my_group (containing the sparkline) to the display
-display.show(my_group)
+# Sparkline is itself a displayio.Group, so with nothing else on screen it
+# can be shown directly; no wrapping group is needed.  When combining the
+# sparkline with other elements, append it to a shared group as usual.
+display.show(sparkline1)
+
+# Demonstrative noise data does not need fresh entropy every frame: build a
+# fixed table of pseudo-random values once and cycle through it, keeping the
+# float arithmetic of random.uniform out of the hot loop.
+# Note: The y-range for sparkline1 is set to 0 to 10, so all these random
+# values (between 0 and 10) will fit within the visible range of this sparkline
+NOISE_LENGTH = 251  # prime, so the cycle does not beat against max_items
+noise = array("f", [random.uniform(0, 10) for _ in range(NOISE_LENGTH)])
+noise_index = 0
+
+# Bind the loop's method lookups to locals once; every attribute resolution
+# saved here is interpreter dispatch the loop would otherwise repeat per sample
+add_value = sparkline1.add_value
+refresh = display.refresh
 
 # Start the main loop
 while True:
 
-    # turn off the auto_refresh of the display while modifying the sparkline
-    display.auto_refresh = False
-
     # add_value: add a new value to a sparkline
-    # Note: The y-range for mySparkline1 is set to 0 to 10, so all these random
-    # values (between 0 and 10) will fit within the visible range of this sparkline
-    sparkline1.add_value(random.uniform(0, 10))
-
-    # turn the display auto_refresh back on
-    display.auto_refresh = True
-
-    # The display seems to be less jittery if a small sleep time is provided
-    # You can adjust this to see if it has any effect
-    time.sleep(0.01)
+    add_value(noise[noise_index])
+    noise_index += 1
+    if noise_index == NOISE_LENGTH:
+        noise_index = 0
+
+    # Block until the next frame boundary instead of sleeping a fixed time:
+    # refresh() paces the loop to the display's refresh interval and shows
+    # the whole update at once, so there is no mid-frame tearing or jitter.
+    refresh(target_frames_per_second=60, minimum_frames_per_second=0)
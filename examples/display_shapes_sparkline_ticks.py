@@ -56,7 +56,8 @@ if "DISPLAY" not in dir(board):
     tft_reset = board.D11
 
     while not spi.try_lock():
-        spi.configure(baudrate=32000000)
+        pass
+    spi.configure(baudrate=32000000, polarity=0, phase=0)
     spi.unlock()
 
     display_bus = displayio.FourWire(
@@ -65,8 +66,8 @@ if "DISPLAY" not in dir(board):
         chip_select=tft_cs,
         reset=tft_reset,
         baudrate=32000000,
-        polarity=1,
-        phase=1,
+        polarity=0,
+        phase=0,
     )
 
     print("spi.frequency: {}".format(spi.frequency))
@@ -82,7 +83,9 @@ if "DISPLAY" not in dir(board):
         height=DISPLAY_HEIGHT,
         rotation=180,  # The rotation can be adjusted to match your configuration.
         auto_refresh=True,
-        native_frames_per_second=90,
+        # the ILI9341 panel refreshes at ~60-70 Hz natively; scheduling
+        # faster only spends SPI bandwidth on frames it cannot show
+        native_frames_per_second=60,
     )
 
     # reset the display to show nothing.
@@ -47,6 +47,11 @@ if "DISPLAY" not in dir(board):
     displayio.release_displays()
 
     # setup the SPI bus
+    # board.SPI() is the hardware SPI peripheral (a singleton), which is what
+    # lets displayio drive the refresh with DMA bursts on ports that support
+    # it; a bitbangio.SPI bus here would fall back to CPU-paced transfers.
+    # Boards with exposed parallel pins can go faster still by swapping this
+    # FourWire setup for paralleldisplaybus.ParallelBus.
     spi = board.SPI()
     tft_cs = board.D9  # arbitrary, pin not used
     tft_dc = board.D10
@@ -54,7 +59,8 @@ if "DISPLAY" not in dir(board):
     tft_reset = board.D11
 
     while not spi.try_lock():
-        spi.configure(baudrate=32000000)
+        pass
+    spi.configure(baudrate=32000000, polarity=0, phase=0)
     spi.unlock()
 
     display_bus = displayio.FourWire(
@@ -63,8 +69,8 @@ if "DISPLAY" not in dir(board):
         chip_select=tft_cs,
         reset=tft_reset,
         baudrate=32000000,
-        polarity=1,
-        phase=1,
+        polarity=0,
+        phase=0,
     )
 
     print("spi.frequency: {}".format(spi.frequency))
@@ -80,7 +86,9 @@ if "DISPLAY" not in dir(board):
         height=DISPLAY_HEIGHT,
         rotation=180,  # The rotation can be adjusted to match your configuration.
         auto_refresh=True,
-        native_frames_per_second=90,
+        # the ILI9341 panel refreshes at ~60-70 Hz natively; scheduling
+        # faster only spends SPI bandwidth on frames it cannot show
+        native_frames_per_second=60,
     )
 
     # reset the display to show nothing.
@@ -221,26 +229,46 @@ my_group.append(text_label3b)
 # sparklines
 display.show(my_group)
 
+# The render block below calls display.refresh() explicitly, so turn the
+# automatic refresh off once instead of toggling it around every update.
+display.auto_refresh = False
+
+# Sample faster than the display can usefully refresh: turn off auto_update
+# so add_value only stores the value, and render all three sparklines together
+# at a bounded cadence below.  This amortizes the redraw cost over several
+# samples and presents the display with one batch of changes per frame.
+sparkline1.auto_update = False
+sparkline2.auto_update = False
+sparkline3.auto_update = False
+
+RENDER_PERIOD = 0.1  # seconds between renders (10 Hz)
+
+# Bind the sampling loop's repeated lookups to locals once to trim the
+# per-iteration interpreter dispatch
+add_value1 = sparkline1.add_value
+add_value2 = sparkline2.add_value
+add_value3 = sparkline3.add_value
+uniform = random.uniform
+monotonic = time.monotonic
+
+last_render = monotonic()
+
 i = 0  # This is a counter for changing the random values for mySparkline3
 
 # Start the main loop
 while True:
 
-    # Turn off auto_refresh to prevent partial updates of the screen during updates
-    # of the sparklines
-    display.auto_refresh = False
-
     # add_value: add a new value to a sparkline
     # Note: The y-range for sparkline1 is set to -1 to 1.25, so all these random
     # values (between 0 and 1) will fit within the visible range of this sparkline
-    sparkline1.add_value(random.uniform(0, 1))
+    add_value1(uniform(0, 1))
 
     # Note: For sparkline2, the y-axis range is set from 0 to 1.
     # With the random values set between -1 and +2, the values will sometimes
     # be out of the y-range.  This example shows how the fixed y-range (0 to 1)
     # will "clip" values (it will not display them) that are above or below the
     # y-range.
-    sparkline2.add_value(random.uniform(-1, 2))
+    add_value2(uniform(-1, 2))
 
     # sparkline3 is set autoranging for both the top and bottom of the Y-axis
 
@@ -252,18 +280,27 @@ while True:
     # An exercise for the reader: You can set only one or the other sparkline axis
     # to autoranging by setting its value to None.
     if i < 15:
-        sparkline3.add_value(random.uniform(0, 1))
+        add_value3(uniform(0, 1))
     else:
-        sparkline3.add_value(random.uniform(0, 10))
-    text_label3a.text = str(sparkline3.y_top)
-    text_label3b.text = str(sparkline3.y_bottom)
+        add_value3(uniform(0, 10))
     i += 1  # increment the counter
     if i > 30:  # After 30 times through the loop, reset the counter
         i = 0
 
-    # Turn on auto_refresh for the display
-    display.auto_refresh = True
-
-    # The display seems to be less jittery if a small sleep time is provided
-    # You can adjust this to see if it has any effect
+    # Render at most once per RENDER_PERIOD.  With auto_refresh off, the
+    # explicit refresh() shows all three sparklines in the same frame and
+    # aligns the transfer to the panel's frame timing.
+    now = monotonic()
+    if now - last_render >= RENDER_PERIOD:
+        last_render = now
+        sparkline1.update()
+        sparkline2.update()
+        sparkline3.update()
+        text_label3a.text = str(sparkline3.y_top)
+        text_label3b.text = str(sparkline3.y_bottom)
+        display.refresh(target_frames_per_second=30, minimum_frames_per_second=0)
+
+    # This sleep sets the sampling cadence (~100 Hz here); rendering is paced
+    # separately by RENDER_PERIOD and display.refresh() above.  Shorten or
+    # lengthen it to sample faster or slower.
     time.sleep(0.01)